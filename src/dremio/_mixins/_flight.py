@@ -12,6 +12,7 @@ from pyarrow.flight import (
 )
 
 from ..models import *
+from ..utils.multithreading import ThreadWithReturnValue as Thread
 
 from . import BaseClass
 from ._dataset import _MixinDataset
@@ -27,6 +28,8 @@ class _MixinFlight(_MixinDataset, BaseClass):
         self, flight_config: Optional[FlightConfig] = None
     ) -> FlightClient:
         """Get the pre-configured pyarrow.flight.FlightClient with optional configuration.
+        Clients are cached per connection parameters, so the TCP/TLS handshake
+        is paid once instead of on every query.
 
         Args:
             flight_config (Optional[FlightConfig], optional): Overwrite pre-config. Defaults to None.
@@ -35,22 +38,47 @@ class _MixinFlight(_MixinDataset, BaseClass):
             FlightClient: [pyarrow.flight.FlightClient](https://arrow.apache.org/docs/python/generated/pyarrow.flight.FlightClient.html)
         """
         flight_config = flight_config or self.flight_config
-        return FlightClient(
-            location=(flight_config.uri(self.hostname)),
-            disable_server_verification=flight_config.disable_certificate_verification,
-            tls_root_certs=flight_config.tls_root_certs,  # type: ignore
+        key = (
+            flight_config.uri(self.hostname),
+            flight_config.disable_certificate_verification,
+            flight_config.path_to_certs,
         )
+        with self._flight_cache_lock:
+            client = self._flight_client_cache.get(key)
+            if client is None:
+                client = FlightClient(
+                    location=(flight_config.uri(self.hostname)),
+                    disable_server_verification=flight_config.disable_certificate_verification,
+                    tls_root_certs=flight_config.tls_root_certs,  # type: ignore
+                )
+                self._flight_client_cache[key] = client
+        return client
+
+    def close_flight_clients(self) -> None:
+        """Close and drop all cached arrow flight clients."""
+        with self._flight_cache_lock:
+            for client in self._flight_client_cache.values():
+                client.close()
+            self._flight_client_cache.clear()
 
     def _flight_options(
         self, flight_config: Optional[FlightConfig] = None
     ) -> FlightCallOptions:
+        # Options are cached by header content, so a token refresh or an
+        # edited config yields a new entry while configs with identical
+        # headers (including short-lived copies) share one.
         flight_config = flight_config or self.flight_config
-        return FlightCallOptions(
-            headers=flight_config.get_headers(
-                {"authorization": f"bearer {self._token}"},
-                as_bytes=True,
-            )  # type: ignore
+        headers = flight_config.get_headers(
+            {"authorization": f"bearer {self._token}"},
+            as_bytes=True,
         )
+        key = tuple(headers)
+        with self._flight_cache_lock:
+            options = self._flight_options_cache.get(key)
+            if options is None:
+                options = FlightCallOptions(headers=headers)  # type: ignore
+                self._flight_options_cache[key] = options
+        return options
 
     def _flight_get_flight_info(
         self, descriptor: FlightDescriptor, options: FlightCallOptions | None = None
@@ -67,23 +95,22 @@ class _MixinFlight(_MixinDataset, BaseClass):
         options = options or self._flight_options()
         return self._flight_client().get_flight_info(descriptor, options)
 
-    def _flight_query_stream(
+    def _flight_info_with_fallback(
         self,
         sql_request: Union[str, SQLRequest],
         *,
         flight_config: Optional[FlightConfig] = None,
         flight_options: Optional[FlightCallOptions] = None,
-    ) -> FlightStreamReader:
-        """Execute a SQL request and get the results as flight data. [learn more](https://arrow.apache.org/docs/python/generated/pyarrow.Table.html)
-        You can use the `.to_pandas()` method on the result to convert it to a pandas DataFrame.
-        Use Dataset.run() for easier handling.
+    ) -> tuple[FlightClient, FlightInfo, FlightCallOptions]:
+        """Resolve the FlightInfo for a SQL request, retrying with adjusted TLS
+        settings if the server rejects the configured connection.
 
         Parameters:
           sql_request (str|SQLRequest): SQL request as SQLRequest object.
           flight_config (FlightConfig | None): Optional: Config for flight. Leave empty to use `Dremio.flight_config`.
 
         Returns:
-          pyarrow.flight.FlightStreamReade: The job results as [pyarrow.flight.FlightStreamReade](https://arrow.apache.org/docs/python/generated/pyarrow.flight.FlightStreamReader.htm).
+          tuple[FlightClient, FlightInfo, FlightCallOptions]: The client, flight info and call options that worked.
         """
         if isinstance(sql_request, str):
             sql_request = SQLRequest(sql_request)
@@ -105,11 +132,14 @@ class _MixinFlight(_MixinDataset, BaseClass):
                 )
                 flight_config_copy = copy.copy(flight_config)
                 flight_config_copy.tls = True
-                results = self._flight_query_stream(
+                results = self._flight_info_with_fallback(
                     sql_request=sql_request, flight_config=flight_config_copy
                 )
+                # persist the working setting, so the next query connects
+                # right away instead of failing and retrying again
+                flight_config.tls = True
                 logging.warning(
-                    "Retry with `flight_config.tls = True` was successful. Set `Dremio.flight_config.tls = True` for future queries."
+                    "Retry with `flight_config.tls = True` was successful. `flight_config.tls` has been set to True for future queries."
                 )
                 return results
             if (
@@ -121,16 +151,78 @@ class _MixinFlight(_MixinDataset, BaseClass):
                 )
                 flight_config_copy = copy.copy(flight_config)
                 flight_config_copy.disable_certificate_verification = True
-                results = self._flight_query_stream(
+                results = self._flight_info_with_fallback(
                     sql_request=sql_request, flight_config=flight_config_copy
                 )
+                # persist the working setting, so the next query connects
+                # right away instead of failing and retrying again
+                flight_config.disable_certificate_verification = True
                 logging.warning(
-                    "Retry with `flight_config.disable_certificate_verification = True` was successful. Set `Dremio.flight_config.disable_certificate_verification = True` for future queries."
+                    "Retry with `flight_config.disable_certificate_verification = True` was successful. `flight_config.disable_certificate_verification` has been set to True for future queries."
                 )
                 return results
             raise e
+        return client, flight_info, options
+
+    def _flight_query_stream(
+        self,
+        sql_request: Union[str, SQLRequest],
+        *,
+        flight_config: Optional[FlightConfig] = None,
+        flight_options: Optional[FlightCallOptions] = None,
+    ) -> FlightStreamReader:
+        """Execute a SQL request and get the results as flight data. [learn more](https://arrow.apache.org/docs/python/generated/pyarrow.Table.html)
+        You can use the `.to_pandas()` method on the result to convert it to a pandas DataFrame.
+        Use Dataset.run() for easier handling.
+
+        Parameters:
+          sql_request (str|SQLRequest): SQL request as SQLRequest object.
+          flight_config (FlightConfig | None): Optional: Config for flight. Leave empty to use `Dremio.flight_config`.
+
+        Returns:
+          pyarrow.flight.FlightStreamReade: The job results as [pyarrow.flight.FlightStreamReade](https://arrow.apache.org/docs/python/generated/pyarrow.flight.FlightStreamReader.htm).
+        """
+        client, flight_info, options = self._flight_info_with_fallback(
+            sql_request,
+            flight_config=flight_config,
+            flight_options=flight_options,
+        )
         return client.do_get(flight_info.endpoints[0].ticket, options)
 
+    def _flight_put(
+        self,
+        table: pyarrow.Table,
+        target: str,
+        *,
+        flight_config: Optional[FlightConfig] = None,
+        flight_options: Optional[FlightCallOptions] = None,
+    ) -> None:
+        """Upload an Arrow table into an existing Dremio table via Flight DoPut.
+
+        The table is transferred in Arrow's columnar wire format, so no SQL
+        text is generated for the data itself.
+
+        Parameters:
+          table (pyarrow.Table): Data to upload.
+          target (str): Dotted path of the target table, e.g. '"A"."B"."C"'.
+          flight_config (FlightConfig | None): Optional: Config for flight. Leave empty to use `Dremio.flight_config`.
+        """
+        flight_config = flight_config or self.flight_config
+        client = self._flight_client(flight_config)
+        options = flight_options or self._flight_options(flight_config)
+
+        descriptor = FlightDescriptor.for_command(f"INSERT INTO {target}")
+        writer, reader = client.do_put(descriptor, table.schema, options)
+        try:
+            # bounded record batches keep the per-message size reasonable for
+            # the gRPC transport, independent of how the table was chunked
+            for batch in table.to_batches(max_chunksize=65536):
+                writer.write_batch(batch)
+            writer.done_writing()
+            reader.read()  # wait for the server to acknowledge the upload
+        finally:
+            writer.close()
+
     def _flight_query(
         self,
         sql_request: Union[str, SQLRequest],
@@ -149,11 +241,33 @@ class _MixinFlight(_MixinDataset, BaseClass):
         Returns:
           pyarrow.Table: The job results as pyarrow.Table.
         """
-        return self._flight_query_stream(
-            sql_request=sql_request,
+        client, flight_info, options = self._flight_info_with_fallback(
+            sql_request,
             flight_config=flight_config,
             flight_options=flight_options,
-        ).read_all()
+        )
+        if len(flight_info.endpoints) > 1:
+            # Dremio can split the result over several endpoints; download them
+            # on parallel connections and concat the partial tables.
+            def fetch(endpoint) -> pyarrow.Table:
+                return client.do_get(endpoint.ticket, options).read_all()
+
+            threads: list[Thread] = []
+            for endpoint in flight_info.endpoints:
+                thread = Thread(target=fetch, args=(endpoint,))
+                threads.append(thread)
+                thread.start()
+            tables: list[pyarrow.Table] = []
+            for thread in threads:
+                table = thread.join()
+                if table is None:
+                    raise DremioConnectorError(
+                        "Flight endpoint fetch failed",
+                        f"Failed to fetch all flight endpoints for {sql_request}",
+                    )
+                tables.append(table)
+            return pyarrow.concat_tables(tables)
+        return client.do_get(flight_info.endpoints[0].ticket, options).read_all()
 
     def _flight_query_dataset(
         self,
@@ -211,9 +325,11 @@ class Flight:
         self.query = mixin._flight_query
         self.query_stream = mixin._flight_query_stream
         self.query_dataset = mixin._flight_query_dataset
+        self.put = mixin._flight_put
         self.config = mixin.flight_config
         self.url = mixin.flight_url
         self.get_client = mixin._flight_client
+        self.close_clients = mixin.close_flight_clients
         self.get_options = mixin._flight_options
         self.get_flight_info = mixin._flight_get_flight_info
 
@@ -1,6 +1,7 @@
 __all__ = ["_MixinFolder"]  # this is like `export ...` in typescript
 import logging
 import re
+from collections import deque
 from typing import Optional, Union, Literal
 from uuid import UUID
 
@@ -307,29 +308,43 @@ class _MixinFolder(_MixinDataset, _MixinCatalog, BaseClass):
         Returns:
             dict: The folder and all children as a dictionary.
         """
-        folder = self.get_folder(path)
-        folder_dict = folder.to_dict()
-
-        folder_dict["children"] = []  # clear children to avoid recursion
-        for child in folder:
-            if (
-                child.type == "CONTAINER"
-                and child.containerType == "FOLDER"
-                and (depth is None or depth > 0)
-            ):
-                child = self.dump_folder(
-                    child.path, depth=depth - 1 if depth is not None else None
-                )
-            elif child.type == "DATASET":
-                ds = self.get_dataset(child.path)
-                child = ds.to_dict()
-            else:
-                logging.warning(
-                    f"Child {child.path} is not a folder or dataset, skipping it."
-                )
-                continue
-            folder_dict["children"].append(child)
-        return folder_dict
+        root_folder = self.get_folder(path)
+        root_dict = root_folder.to_dict()
+        root_dict["children"] = []  # clear children to avoid recursion
+
+        # iterative depth-first traversal with an explicit stack instead of
+        # one Python frame per nested folder
+        stack: deque[tuple[Folder, dict, int | None]] = deque(
+            [(root_folder, root_dict, depth)]
+        )
+        while stack:
+            folder, folder_dict, depth_left = stack.pop()
+            for child in folder:
+                if (
+                    child.type == "CONTAINER"
+                    and child.containerType == "FOLDER"
+                    and (depth_left is None or depth_left > 0)
+                ):
+                    subfolder = self.get_folder(child.path)
+                    child_dict = subfolder.to_dict()
+                    child_dict["children"] = []
+                    stack.append(
+                        (
+                            subfolder,
+                            child_dict,
+                            depth_left - 1 if depth_left is not None else None,
+                        )
+                    )
+                elif child.type == "DATASET":
+                    ds = self.get_dataset(child.path)
+                    child_dict = ds.to_dict()
+                else:
+                    logging.warning(
+                        f"Child {child.path} is not a folder or dataset, skipping it."
+                    )
+                    continue
+                folder_dict["children"].append(child_dict)
+        return root_dict
 
     @experimental
     def restore_folder(
@@ -1,11 +1,18 @@
 __all__ = ["_MixinTable"]  # this is like `export ...` in typescript
+import io
 import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 from datetime import datetime, date
 from typing import Optional
+from uuid import uuid4
+from pyarrow.flight import FlightError
 
 from ..utils.converter import path_to_dotted, path_to_list
+from ..utils.multithreading import ThreadWithReturnValue as Thread
 from ..exceptions import DremioError
 
 
@@ -15,32 +22,84 @@ from ._sql import _MixinSQL
 from ._flight import _MixinFlight
 from ._query import _MixinQuery
 
+# Dremio SQL type per base Polars dtype; anything unlisted becomes VARCHAR
+_DTYPE_SQL: dict = {
+    pl.Int8: "BIGINT",
+    pl.Int16: "BIGINT",
+    pl.Int32: "BIGINT",
+    pl.Int64: "BIGINT",
+    pl.UInt8: "BIGINT",
+    pl.UInt16: "BIGINT",
+    pl.UInt32: "BIGINT",
+    pl.UInt64: "BIGINT",
+    pl.Float32: "DOUBLE",
+    pl.Float64: "DOUBLE",
+    pl.Boolean: "BOOLEAN",
+    pl.Datetime: "TIMESTAMP",
+    pl.Date: "TIMESTAMP",
+}
+
+
 def map_dtype_to_sql(dtype: pl.DataType) -> str:
     """Maps Polars dtype to Dremio SQL data type."""
-    if dtype == pl.Int8 or dtype == pl.Int16 or dtype == pl.Int32 or dtype == pl.Int64:
-        return "BIGINT"
-    elif (
-        dtype == pl.UInt8
-        or dtype == pl.UInt16
-        or dtype == pl.UInt32
-        or dtype == pl.UInt64
-    ):
+    # base_type() folds parametrized dtypes (e.g. Datetime("us")) onto the
+    # plain dtype classes used as dict keys
+    return _DTYPE_SQL.get(dtype.base_type(), "VARCHAR")
+
+
+def map_arrow_type_to_sql(dtype: pa.DataType) -> str:
+    """Maps an Arrow data type to a Dremio SQL data type."""
+    if pa.types.is_integer(dtype):
         return "BIGINT"
-    elif dtype == pl.Float32 or dtype == pl.Float64:
+    elif pa.types.is_floating(dtype):
         return "DOUBLE"
-    elif dtype == pl.Boolean:
+    elif pa.types.is_boolean(dtype):
         return "BOOLEAN"
-    elif dtype == pl.Datetime or dtype == pl.Date:
+    elif pa.types.is_timestamp(dtype) or pa.types.is_date(dtype):
         return "TIMESTAMP"
     else:
         return "VARCHAR"
 
 
+def _escape_sql_str(val: str) -> str:
+    # skip the replace-allocation for the common quote-free case
+    if "'" in val:
+        val = val.replace("'", "''")
+    return f"'{val}'"
+
+
+def _escape_sql_float(val: float) -> str:
+    return "NULL" if val != val else str(val)  # NaN check
+
+
+def _escape_sql_datetime(val: datetime) -> str:
+    return f"TIMESTAMP '{val.isoformat(sep=' ', timespec='seconds')}'"
+
+
+def _escape_sql_date(val: date) -> str:
+    return f"DATE '{val.isoformat()}'"
+
+
+# formatter per exact value type; bool before int doesn't matter here because
+# the dispatch is on type(val), not isinstance
+_ESCAPE_HANDLERS: dict = {
+    type(None): lambda val: "NULL",
+    str: _escape_sql_str,
+    int: str,
+    float: _escape_sql_float,
+    bool: lambda val: "TRUE" if val else "FALSE",
+    datetime: _escape_sql_datetime,
+    date: _escape_sql_date,
+}
+
+
 def escape_sql_value(val) -> str:
     """Escapes and formats a value for SQL insertion."""
-    if val is None:
-        return "NULL"
-    elif isinstance(val, float) and (val != val):  # NaN check
+    handler = _ESCAPE_HANDLERS.get(type(val))
+    if handler is not None:
+        return handler(val)
+    # slow path for subclasses of the handled types and anything unlisted
+    if isinstance(val, float) and (val != val):  # NaN check
         return "NULL"
     elif isinstance(val, str):
         val_escaped = val.replace("'", "''")
@@ -53,6 +112,79 @@ def escape_sql_value(val) -> str:
     else:
         return str(val)
 
+def _sql_expr_utf8(col: str) -> pl.Expr:
+    return (
+        pl.lit("'")
+        + pl.col(col).str.replace_all("'", "''", literal=True)
+        + pl.lit("'")
+    )
+
+
+def _sql_expr_datetime(col: str) -> pl.Expr:
+    return (
+        pl.lit("TIMESTAMP '")
+        + pl.col(col).dt.strftime("%Y-%m-%d %H:%M:%S")
+        + pl.lit("'")
+    )
+
+
+def _sql_expr_date(col: str) -> pl.Expr:
+    return pl.lit("DATE '") + pl.col(col).dt.strftime("%Y-%m-%d") + pl.lit("'")
+
+
+def _sql_expr_boolean(col: str) -> pl.Expr:
+    return (
+        pl.when(pl.col(col))
+        .then(pl.lit("TRUE"))
+        .when(pl.col(col).is_not_null())
+        .then(pl.lit("FALSE"))
+        .otherwise(None)
+    )
+
+
+def _sql_expr_float(col: str) -> pl.Expr:
+    return pl.col(col).fill_nan(None).cast(pl.Utf8)
+
+
+def _sql_expr_default(col: str) -> pl.Expr:
+    return pl.col(col).cast(pl.Utf8)
+
+
+# SQL literal formatter per base dtype; resolved once per column, not per cell
+_SQL_EXPR_BUILDERS: dict = {
+    pl.Utf8: _sql_expr_utf8,
+    pl.Datetime: _sql_expr_datetime,
+    pl.Date: _sql_expr_date,
+    pl.Boolean: _sql_expr_boolean,
+    pl.Float32: _sql_expr_float,
+    pl.Float64: _sql_expr_float,
+}
+
+
+def sql_value_rows(df: pl.DataFrame) -> list[str]:
+    """Builds one "(v1, v2, ...)" SQL literal string per row.
+
+    The escaping is done column-wise with vectorized Polars expressions instead
+    of calling `escape_sql_value` per cell, which keeps the string formatting
+    out of the Python interpreter loop. The formatter for each column is
+    selected once from its dtype.
+
+    Args:
+        df: Polars DataFrame to render as SQL VALUES rows.
+
+    Returns:
+        A list with one "(...)" string per row of the DataFrame.
+    """
+    exprs = [
+        _SQL_EXPR_BUILDERS.get(df.schema[col].base_type(), _sql_expr_default)(col)
+        .fill_null("NULL")
+        .alias(col)
+        for col in df.columns
+    ]
+    row_expr = pl.lit("(") + pl.concat_str(exprs, separator=", ") + pl.lit(")")
+    return df.select(row_expr.alias("row"))["row"].to_list()
+
+
 def sql_merge_on_clause(on: dict[str, str] | str, source_var:str="s", target_var:str="t") -> str:
     """
     Converts a dictionary or string into a SQL ON clause for MERGE statements.
@@ -73,6 +205,9 @@ def sql_merge_on_clause(on: dict[str, str] | str, source_var:str="s", target_var
         raise TypeError("on must be a dict or a string.")
 
 def dotted_full_path(path: list[str] | str, name: Optional[str] = None) -> str:
+    if isinstance(path, str) and '"' not in path and "'" not in path and "[" not in path:
+        # plain dotted string: splitting and re-joining would return it verbatim
+        return f"{path}.{name}" if name else path
     path = path_to_list(path)
     return f"{'.'.join(path)}.{name}" if name else ".".join(path)
 
@@ -95,7 +230,9 @@ class _MixinTable(_MixinQuery, _MixinFlight, _MixinDataset, _MixinSQL, BaseClass
         path: list[str] | str,
         df: pd.DataFrame | pl.DataFrame,
         *,
-        batch_size: int = 1000,
+        batch_size: int = 10_000,
+        max_bytes: int = 4 * 1024 * 1024,
+        max_insert_concurrency: int = 8,
     ) -> None:
         """
         Creates an Iceberg table in Dremio from a Pandas DataFrame.
@@ -103,6 +240,13 @@ class _MixinTable(_MixinQuery, _MixinFlight, _MixinDataset, _MixinSQL, BaseClass
         Args:
             path: Path in the Dremio catalog where the table should be created.
             df: Pandas or Polars DataFrame to use for schema and data insertion.
+            batch_size: Maximum number of rows per fallback INSERT statement.
+                Frames smaller than this (and within max_bytes) are created
+                in a single CTAS query.
+            max_bytes: Approximate maximum payload size per fallback INSERT
+                statement; wide rows flush earlier than batch_size.
+            max_insert_concurrency: Number of fallback INSERT statements that
+                may be in flight at the same time.
         """
 
         if isinstance(df, pd.DataFrame):
@@ -111,15 +255,44 @@ class _MixinTable(_MixinQuery, _MixinFlight, _MixinDataset, _MixinSQL, BaseClass
             raise TypeError("df must be a Pandas or Polars DataFrame.")
         warning_large_table_creation(df)
 
-        # 1. Create table using DataFrame schema
-        column_definitions = []
-        for col in df.columns:
-            sql_type = map_dtype_to_sql(df[col].dtype)
-            column_definitions.append(f'"{col}" {sql_type}')
-        columns_sql = ",\n  ".join(column_definitions)
-        
         path = path_to_dotted(path)
 
+        # Small frames fit into a single statement: fuse CREATE and the data
+        # into one CTAS, so the table lands in one round-trip instead of a
+        # CREATE followed by a separate upload. Gated on the byte budget too,
+        # so few-but-wide rows don't produce an oversized statement.
+        if 0 < df.height < batch_size and df.estimated_size() <= max_bytes:
+            # explicit CASTs pin the column types to the same mapping the DDL
+            # path uses — literal inference would otherwise pick narrower
+            # types, and an all-null column would stay untyped entirely
+            select_sql = ", ".join(
+                f'CAST("{col}" AS {map_dtype_to_sql(df.schema[col])}) AS "{col}"'
+                for col in df.columns
+            )
+            columns_sql = ", ".join(f'"{col}"' for col in df.columns)
+            values_sql = ",\n".join(sql_value_rows(df))
+            ctas_sql = (
+                f"CREATE TABLE {path} AS\n"
+                f"SELECT {select_sql} FROM (VALUES\n{values_sql}\n) AS t({columns_sql})"
+            )
+            try:
+                self.query(ctas_sql)
+            except DremioError as e:
+                if e.status_code == 409:
+                    e.errorMessage = (
+                        f"Table '{path}' already exists. Use update_dataset() to modify it."
+                        + e.errorMessage
+                    )
+                raise e
+            return
+
+        # 1. Create table using the Arrow schema of the DataFrame
+        arrow_table = df.to_arrow()
+        columns_sql = ",\n  ".join(
+            f'"{field.name}" {map_arrow_type_to_sql(field.type)}'
+            for field in arrow_table.schema
+        )
+
         create_sql = f"""
         CREATE TABLE {path}
         (
@@ -138,26 +311,53 @@ class _MixinTable(_MixinQuery, _MixinFlight, _MixinDataset, _MixinSQL, BaseClass
                 )
                 raise e
 
-        # 2. Batch insert rows
-        value_rows = []
-
-        for row in df.iter_rows(named=False):
-            values = ", ".join(escape_sql_value(val) for val in row)
-            value_rows.append(f"({values})")
-            if len(value_rows) >= batch_size:
-                insert_sql = f"""
-                INSERT INTO {path} VALUES
-                {",\n".join(value_rows)}
-                """
-                self.query(insert_sql)
-                value_rows = []
-
-        if value_rows:
-            insert_sql = f"""
-            INSERT INTO {path} VALUES
-            {",\n".join(value_rows)}
-            """
-            self.query(insert_sql)
+        # 2. Bulk insert rows via Arrow Flight DoPut (columnar, no SQL text)
+        try:
+            self._flight_put(arrow_table, path)
+            return
+        except (FlightError, NotImplementedError) as e:
+            logging.warning(
+                f"Arrow Flight DoPut not available ({e}). "
+                "Falling back to batched INSERT statements."
+            )
+
+        # Fallback: batch insert rows as INSERT INTO ... VALUES statements.
+        # Batches are submitted on a small worker pool so the network round-trip
+        # of batch N overlaps with building the payload of batch N+1. INSERTs
+        # into Iceberg are commutative, so the submission order does not matter.
+        value_rows = sql_value_rows(df)
+        insert_header = f"INSERT INTO {path} VALUES\n"
+        pending: deque[Future] = deque()
+        buf = io.StringIO()
+        try:
+            with ThreadPoolExecutor(max_workers=max_insert_concurrency) as executor:
+
+                def flush() -> None:
+                    insert_sql = insert_header + buf.getvalue()[:-2]  # drop ",\n"
+                    buf.seek(0)
+                    buf.truncate()
+                    while len(pending) >= max_insert_concurrency:
+                        pending.popleft().result()
+                    pending.append(executor.submit(self.query, insert_sql))
+
+                # the rows are streamed into one reused buffer and flushed on
+                # whichever limit is hit first: row count or payload bytes, so
+                # wide rows don't blow up the statement size
+                rows_in_batch = 0
+                for row in value_rows:
+                    buf.write(row)
+                    buf.write(",\n")
+                    rows_in_batch += 1
+                    if rows_in_batch >= batch_size or buf.tell() >= max_bytes:
+                        flush()
+                        rows_in_batch = 0
+                if rows_in_batch:
+                    flush()
+                while pending:
+                    pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
 
     def create_table_from_sql(self, path: list[str] | str, sql: str) -> None:
         """
@@ -193,7 +393,9 @@ class _MixinTable(_MixinQuery, _MixinFlight, _MixinDataset, _MixinSQL, BaseClass
         path: str,
         based_on: pd.DataFrame | pl.DataFrame | str,
         *,
-        batch_size: int = 1000,
+        batch_size: int = 10_000,
+        max_bytes: int = 4 * 1024 * 1024,
+        max_insert_concurrency: int = 8,
     ) -> None:
         """
         Creates an Iceberg table in Dremio either from a Pandas/Polars DataFrame or an SQL query.
@@ -212,7 +414,11 @@ class _MixinTable(_MixinQuery, _MixinFlight, _MixinDataset, _MixinSQL, BaseClass
             )
         if isinstance(based_on, (pd.DataFrame, pl.DataFrame)):
             self.create_table_from_dataframe(
-                df=based_on, path=path, batch_size=batch_size
+                df=based_on,
+                path=path,
+                batch_size=batch_size,
+                max_bytes=max_bytes,
+                max_insert_concurrency=max_insert_concurrency,
             )
         elif isinstance(based_on, str):
             self.create_table_from_sql(sql=based_on, path=path)
@@ -258,10 +464,10 @@ class _MixinTable(_MixinQuery, _MixinFlight, _MixinDataset, _MixinSQL, BaseClass
         WHEN MATCHED THEN UPDATE SET *
         WHEN NOT MATCHED THEN INSERT *
         """
-        print(merge_sql)
+        logging.debug("%s", merge_sql)
         self.query(merge_sql)
 
-    def update_table_from_dataframe(self, path: list[str]|str, df: pd.DataFrame | pl.DataFrame,  *, on: dict[str,str]|str = {'id':'id'}, batch_size: int = 1000, keep_temp_table: bool = False) -> None:
+    def update_table_from_dataframe(self, path: list[str]|str, df: pd.DataFrame | pl.DataFrame,  *, on: dict[str,str]|str = {'id':'id'}, batch_size: int = 10_000, keep_temp_table: bool = False) -> None:
         """
         Updates or inserts rows into an existing Iceberg table in Dremio using MERGE INTO.
     
@@ -277,50 +483,136 @@ class _MixinTable(_MixinQuery, _MixinFlight, _MixinDataset, _MixinSQL, BaseClass
             RuntimeError: If the target table does not exist.
         """
 
-        if isinstance(df, pd.DataFrame):
-            df = pl.from_pandas(df)
-        if not isinstance(df, pl.DataFrame):
-            raise TypeError("df must be a Pandas or Polars DataFrame.")
-        warning_large_table_creation(df)
-    
-        # Create a temp table to use as the merge source
+        # type checking and pandas conversion are left to
+        # create_table_from_dataframe, which stages the data anyway
+
+        # Stage the DataFrame as a short-lived merge source. The staging table
+        # is filled via the Flight DoPut path of create_table_from_dataframe,
+        # so no INSERT VALUES round-trips are materialized here. A UUID suffix
+        # keeps concurrent updates on the same table from colliding.
         path = path_to_list(path)
         table_name = path[-1]
         folder = path_to_dotted(path[0:-1])
-        temp_table_path = path_to_dotted(f"{folder}.{table_name}_temp_update")
-        self.create_table_from_dataframe(df=df, path=temp_table_path, batch_size=batch_size)
+        staging_table_path = path_to_dotted(
+            f"{folder}.{table_name}_staging_{uuid4().hex[:8]}"
+        )
+        self.create_table_from_dataframe(
+            df=df, path=staging_table_path, batch_size=batch_size
+        )
 
         merge_sql = f"""
         MERGE INTO {path_to_dotted(path)} AS t
-        USING {temp_table_path} AS s
+        USING {staging_table_path} AS s
         ON ({sql_merge_on_clause(on, source_var='s', target_var='t')})
         WHEN MATCHED THEN UPDATE SET *
         WHEN NOT MATCHED THEN INSERT *
-        """  
-        try:
-            self.query(merge_sql)
-            pass
-        except DremioError as e:
-            raise e
-        
-        if not keep_temp_table:
+        """
+        self.query(merge_sql)
+
+        if keep_temp_table:
+            # the generated name is random, so surface it — otherwise the
+            # kept table is undiscoverable
+            logging.info(f"Keeping staging table {staging_table_path}")
+            return
+
+        # the merge result does not depend on the staging table anymore,
+        # so the commit of its DROP doesn't have to be waited for
+        def drop_staging_table():
             try:
-                drop_sql = f"DROP TABLE {temp_table_path}"
-                self.query(drop_sql)
-            except DremioError as e:
-                raise e
+                self.query(f"DROP TABLE {staging_table_path}")
+            except Exception as e:
+                # a leaked staging table is not worth crashing the worker
+                # thread over, whatever the error type
+                logging.warning(
+                    f"Failed to drop staging table {staging_table_path}: {e}"
+                )
 
-    # def get_table_files_metadata(dremio: Dremio, path):
-    #     return dremio.query(f"SELECT * FROM TABLE(table_files('{path}.{table_name}'))").to_pandas()
-    
-    # def get_table_history_metadata(dremio: Dremio, path, table_name):
-    #     return dremio.query(f"SELECT * FROM TABLE(table_history('{path}.{table_name}'))").to_pandas()
-    
-    # def get_table_manifests_metadata(dremio: Dremio, path, table_name):
-    #     return dremio.query(f"SELECT * FROM TABLE(table_manifests('{path}.{table_name}'))").to_pandas()
-    
-    # def get_table_partitions_metadata(dremio: Dremio, path, table_name):
-    #     return dremio.query(f"SELECT * FROM TABLE(table_partitions('{path}.{table_name}'))").to_pandas()
-    
-    # def get_table_snapshot_metadata(dremio: Dremio, path, table_name):
-    #     return dremio.query(f"SELECT * FROM TABLE(table_snapshot('{path}.{table_name}'))").to_pandas()
+        Thread(target=drop_staging_table).start()
+
+    TABLE_METADATA_KINDS = ("files", "history", "manifests", "partitions", "snapshot")
+
+    def _get_table_metadata(
+        self, path: list[str] | str, kind: str, as_polars: bool = True
+    ):
+        sql = f"SELECT * FROM TABLE(table_{kind}('{dotted_full_path(path)}'))"
+        result = self.query(sql)
+        return result.to_polars() if as_polars else result.to_pandas()
+
+    def get_table_files_metadata(self, path: list[str] | str, *, as_polars: bool = True):
+        """Get the Iceberg data file metadata of a table.
+
+        Args:
+            path: Path of the table in the Dremio catalog.
+            as_polars: Return a Polars DataFrame (default) instead of Pandas.
+        """
+        return self._get_table_metadata(path, "files", as_polars)
+
+    def get_table_history_metadata(self, path: list[str] | str, *, as_polars: bool = True):
+        """Get the Iceberg history metadata of a table.
+
+        Args:
+            path: Path of the table in the Dremio catalog.
+            as_polars: Return a Polars DataFrame (default) instead of Pandas.
+        """
+        return self._get_table_metadata(path, "history", as_polars)
+
+    def get_table_manifests_metadata(self, path: list[str] | str, *, as_polars: bool = True):
+        """Get the Iceberg manifest metadata of a table.
+
+        Args:
+            path: Path of the table in the Dremio catalog.
+            as_polars: Return a Polars DataFrame (default) instead of Pandas.
+        """
+        return self._get_table_metadata(path, "manifests", as_polars)
+
+    def get_table_partitions_metadata(self, path: list[str] | str, *, as_polars: bool = True):
+        """Get the Iceberg partition metadata of a table.
+
+        Args:
+            path: Path of the table in the Dremio catalog.
+            as_polars: Return a Polars DataFrame (default) instead of Pandas.
+        """
+        return self._get_table_metadata(path, "partitions", as_polars)
+
+    def get_table_snapshot_metadata(self, path: list[str] | str, *, as_polars: bool = True):
+        """Get the Iceberg snapshot metadata of a table.
+
+        Args:
+            path: Path of the table in the Dremio catalog.
+            as_polars: Return a Polars DataFrame (default) instead of Pandas.
+        """
+        return self._get_table_metadata(path, "snapshot", as_polars)
+
+    def get_all_table_metadata(
+        self, path: list[str] | str, *, as_polars: bool = True
+    ) -> dict:
+        """Get all Iceberg metadata kinds of a table with parallel queries.
+
+        The five metadata queries are independent, so they are submitted on
+        one thread each instead of five sequential round-trips.
+
+        Args:
+            path: Path of the table in the Dremio catalog.
+            as_polars: Return Polars DataFrames (default) instead of Pandas.
+
+        Returns:
+            dict: DataFrame per metadata kind, keyed by
+                'files', 'history', 'manifests', 'partitions' and 'snapshot'.
+        """
+        threads: dict[str, Thread] = {}
+        for kind in self.TABLE_METADATA_KINDS:
+            thread = Thread(
+                target=self._get_table_metadata, args=(path, kind, as_polars)
+            )
+            threads[kind] = thread
+            thread.start()
+        results = {}
+        for kind, thread in threads.items():
+            result = thread.join()
+            if result is None:
+                raise DremioError(
+                    "Table metadata query failed",
+                    f"Failed to fetch {kind} metadata for '{dotted_full_path(path)}'",
+                )
+            results[kind] = result
+        return results
@@ -1,6 +1,7 @@
 __all__ = ["Dremio"]  # this is like `export ...` in typescript
 
 import logging
+import threading
 from urllib import parse
 import requests
 from requests.exceptions import JSONDecodeError
@@ -58,6 +59,11 @@ class Dremio:
             else flight_config
         )
         self._headers: dict[str, str] = {"Content-Type": "application/json"}
+        self._flight_client_cache: dict = {}
+        self._flight_options_cache: dict = {}
+        # guards both flight caches: parallel fetches would otherwise race
+        # the get-then-insert and leak extra clients
+        self._flight_cache_lock = threading.Lock()
         if loglevel:
             self.set_log_level(loglevel)
         if auth or token:
@@ -66,9 +66,23 @@ class JobResult:
 
     rowCount: int
     schema: Schema[pyarrow.DataType] | Schema[SQLType]
-    rows: list[dict[str, Any]]
+    # row dicts are expensive to build, so they are materialized lazily from
+    # the arrow table on first access of `rows`
+    _rows: Optional[list[dict[str, Any]]] = None
+    # original arrow table, kept for fast to_polars/to_pandas conversion
+    _arrow: Optional[pyarrow.Table] = None
     # jobId: Optional[UUID] = None
 
+    @property
+    def rows(self) -> list[dict[str, Any]]:
+        if self._rows is None:
+            self._rows = self._arrow.to_pylist() if self._arrow is not None else []
+        return self._rows
+
+    @rows.setter
+    def rows(self, value: list[dict[str, Any]]) -> None:
+        self._rows = value
+
     @staticmethod
     def from_arrow_table(arrow_table: pyarrow.Table) -> "JobResult":
         schema_names: list[str] = arrow_table.schema.names
@@ -76,14 +90,14 @@ class JobResult:
         schema = Schema[pyarrow.DataType](
             [{"name": n, "type": t} for n, t in zip(schema_names, schema_types)]
         )
-        rows = arrow_table.to_pylist()
-        rowCount = len(rows)
-        return JobResult(rowCount=rowCount, schema=schema, rows=rows)
+        return JobResult(
+            rowCount=arrow_table.num_rows, schema=schema, _arrow=arrow_table
+        )
 
     @staticmethod
     def from_dict(d: JobResultDict) -> "JobResult":
         schema = Schema[SQLType](d["schema"])
-        return JobResult(rowCount=d["rowCount"], rows=d["rows"], schema=schema)
+        return JobResult(rowCount=d["rowCount"], _rows=d["rows"], schema=schema)
 
     @property
     def dict(self) -> JobResultDict:
@@ -108,7 +122,12 @@ class JobResult:
         t.align = "l"
         t.add_row(self.schema.type_names)
         t.add_divider()
-        for r in self.rows[:number_of_rows]:
+        if self._rows is None and self._arrow is not None and number_of_rows >= 0:
+            # only convert the previewed slice, not the whole table
+            preview_rows = self._arrow.slice(0, number_of_rows).to_pylist()
+        else:
+            preview_rows = self.rows[:number_of_rows]
+        for r in preview_rows:
             t.add_row(list(r.values()))
         if number_of_rows < self.rowCount:
             t.add_row(["..."] * len(self.schema.names))
@@ -170,13 +189,21 @@ class JobResult:
         if isinstance(key, int) or isinstance(key, slice):
             return self.rows[key]
 
-        if key not in self.schema.names:
+        index = self.schema._name_index.get(key)
+        if index is None:
             raise KeyError(f"Key '{key}' not found in schema.")
-        index = self.schema.names.index(key)
         col = self.to_polars().to_series(index)
         return col.to_list()
 
     def __iter__(self):
+        if self._rows is None and self._arrow is not None:
+            # iterate batch by batch so looping over a large result doesn't
+            # require materializing every row dict up front
+            def iter_batches():
+                for batch in self._arrow.to_batches():
+                    yield from batch.to_pylist()
+
+            return iter_batches()
         return iter(self.rows)
 
     def __next__(self):
@@ -197,6 +224,9 @@ class JobResult:
 
         [Polars Docs](https://docs.pola.rs/py-polars/html/reference/dataframe/index.html)
         """
+        if self._arrow is not None:
+            # zero-copy where possible, instead of rebuilding from row dicts
+            return pl.from_arrow(self._arrow)  # type: ignore
         return pl.DataFrame(self.rows)
 
     def to_pandas(self):
@@ -206,4 +236,6 @@ class JobResult:
         """
         import pandas as pd
 
+        if self._arrow is not None:
+            return self._arrow.to_pandas()
         return pd.DataFrame(self.rows)
@@ -18,42 +18,95 @@ class SchemaField[T: pyarrow.DataType | SQLType](TypedDict):
 class Schema[T: pyarrow.DataType | SQLType](list):
     def __init__(self, iterable: list[SchemaField[T]]):
         super().__init__(SchemaField[T](item) for item in iterable)
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        # field name -> position, so lookups by name don't scan the list
+        index: dict[str, int] = {}
+        for i, item in enumerate(self):
+            try:
+                index[item["name"]] = i
+            except (TypeError, KeyError):
+                continue
+        self._name_index = index
+        # derived lists are cached lazily; any mutation lands here and drops them
+        self._names: Optional[list[str]] = None
+        self._types: Optional[list[T]] = None
+        self._type_names: Optional[list[str]] = None
 
     def __setitem__(self, index, item):
         super().__setitem__(index, SchemaField[T](item))
+        self._rebuild_index()
 
     def __getitem__(self, key: int | str):
-        for item in self:
-            try:
-                if item["name"] == key:
-                    return item
-            except:
-                continue
+        if isinstance(key, str):
+            index = self._name_index.get(key)
+            if index is not None:
+                return super().__getitem__(index)
         return super().__getitem__(key)  # type: ignore
 
     def insert(self, index, item):
         super().insert(index, SchemaField[T](item))
+        self._rebuild_index()
 
     def append(self, item):
         super().append(SchemaField[T](item))
+        self._rebuild_index()
 
     def extend(self, other):
         if isinstance(other, type(self)):
             super().extend(other)
         else:
             super().extend(SchemaField[T](item) for item in other)
+        self._rebuild_index()
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._rebuild_index()
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._rebuild_index()
+        return item
+
+    def remove(self, item):
+        super().remove(item)
+        self._rebuild_index()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._rebuild_index()
+
+    def reverse(self):
+        super().reverse()
+        self._rebuild_index()
+
+    def clear(self):
+        super().clear()
+        self._rebuild_index()
 
     @property
     def names(self) -> list[str]:
-        return [f["name"] for f in self]
+        if self._names is None:
+            self._names = [f["name"] for f in self]
+        return self._names
 
     @property
     def types(self) -> list[T]:
-        return [f["type"] for f in self]
+        if self._types is None:
+            self._types = [f["type"] for f in self]
+        return self._types
 
     @property
     def type_names(self) -> list[str]:
-        types = self.types
-        if isinstance(types[0], dict):
-            return [t["name"] for t in types]  # type: ignore
-        return [str(t) for t in types]
+        if self._type_names is None:
+            types = self.types
+            if isinstance(types[0], dict):
+                self._type_names = [t["name"] for t in types]  # type: ignore
+            else:
+                self._type_names = [str(t) for t in types]
+        return self._type_names
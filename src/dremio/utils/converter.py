@@ -1,89 +1,253 @@
-from dataclasses import asdict
+import ast
+import dataclasses
+from functools import lru_cache
 from uuid import UUID
 from typing import Union
 import re
+import sys
+
+# The path grammar is regular (no backreferences or lookarounds), so a DFA
+# engine runs it in linear time. google-re2 is optional — install the
+# `speedups` extra — and the stdlib engine is used when it is missing or
+# rejects a pattern.
+try:
+    import re2 as _re_engine  # type: ignore
+except ImportError:
+    _re_engine = re
+
+
+def _compile(pattern: str):
+    try:
+        return _re_engine.compile(pattern)
+    except Exception:
+        return re.compile(pattern)
+
+
+# Regex to capture segments, quoted or unquoted, separated by commas.
+# Alternatives in the capture group: double quoted string (with escapes),
+# single quoted string (with escapes), unquoted segment (no commas or quotes);
+# each segment may carry whitespace and ends on a comma or end of string.
+# Compiled compact (without re.VERBOSE) so the automaton carries no
+# whitespace/comment-skipping states.
+_SEGMENT_RE = _compile(
+    r'\s*("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|[^,\'" ](?:[^,]*)?)\s*(?:,|$)'
+)
+
+# Tokenizer for dotted notation, treating quoted segments as atomic.
+# Group 1: double-quoted segment (may contain dots), group 2: single-quoted
+# segment (may contain dots), group 3: unquoted segment (no dots allowed).
+_TOKEN_RE = _compile(r'"(.*?)"|\'(.*?)\'|([^.]+)')
+
+
+def _intern(tok: str) -> str:
+    # the same segment names ("dremio", space names, ...) recur across
+    # thousands of calls; interning collapses them to one object and turns
+    # downstream dict lookups into pointer compares. Gated on length so
+    # user data blobs don't end up in the intern table.
+    return sys.intern(tok) if len(tok) < 64 else tok
+
+
+def _is_bracketed(path: str) -> bool:
+    """Detects bracketed list strings like: [a, b, "c d", 'e f']"""
+    return path[:1] == "[" and path[-1:] == "]"
+
+
+@lru_cache(maxsize=None)
+def _field_plan(cls) -> frozenset:
+    """Returns the field names a dataclass type excludes from to_dict.
+
+    The leading-underscore convention is a property of the type, not the
+    instance, so it is reflected once per class instead of per conversion.
+    """
+    return frozenset(
+        f.name
+        for f in dataclasses.fields(cls)
+        if f.name.startswith("_") and not f.name.startswith("__")
+    )
+
+
+def _to_plain(value):
+    """Recursively converts dataclasses into plain dicts.
+
+    Unlike `dataclasses.asdict` this does not deep-copy leaf values: scalars,
+    and any container that holds no dataclass, are carried over by reference,
+    which is all the JSON payload call sites need.
+    """
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            f.name: _to_plain(getattr(value, f.name))
+            for f in dataclasses.fields(value)
+        }
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _to_plain(v) for k, v in value.items()}
+    return value
 
 
 def to_dict(d) -> dict:
-    # print('obj',obj)
-    d = asdict(d)
+    skip_fields = _field_plan(type(d))
+    d = _to_plain(d)
     result = {}
     for key, value in d.items():
+        if key in skip_fields:
+            continue
         if isinstance(value, UUID):
             result[key] = str(value)
-        if isinstance(key, str):
-            if key[0] == "_" and key[1] != "_":
-                continue
-        result[key] = value
+        else:
+            result[key] = value
     return result
 
 
+def _tokenize(path: str) -> tuple[str, ...]:
+    """Splits dotted notation on '.' treating quoted segments as atomic.
+
+    Hand-rolled equivalent of _TOKEN_RE for short inputs: plain index
+    arithmetic beats the regex engine's per-call setup there. A quote only
+    opens a segment at token start, and an unterminated quote is consumed
+    literally — both exactly as the regex behaves.
+    """
+    tokens: list[str] = []
+    i = 0
+    n = len(path)
+    while i < n:
+        c = path[i]
+        if c == '"' or c == "'":
+            end = path.find(c, i + 1)
+            if end != -1:
+                if end > i + 1:
+                    tokens.append(_intern(path[i + 1:end]))
+                i = end + 1
+                continue
+        end = path.find(".", i)
+        if end == -1:
+            end = n
+        if end > i:
+            tokens.append(_intern(path[i:end]))
+        i = end + 1
+    return tuple(tokens)
+
+
+@lru_cache(maxsize=1024)
+def _path_to_list_str(path: str) -> tuple[str, ...]:
+    """Parses a path string into its segments.
+
+    Pure in its argument, so results are memoized; the tuple return keeps
+    cache entries immutable. `path_to_list` converts back to a list.
+    """
+    # Fast path: a plain dotted identifier needs no regex at all
+    if not any(c in path for c in '\'"[ ,'):
+        return tuple(_intern(t) for t in path.split(".") if t)
+
+    stripped = path.strip()
+    if _is_bracketed(stripped):
+        inner = stripped[1:-1]
+
+        # A well-formed list literal like '["a", "b"]' parses in one call via
+        # CPython's C tokenizer; unquoted identifiers fall back to the regex.
+        try:
+            raw = ast.literal_eval(stripped)
+            if isinstance(raw, (list, tuple)):
+                return tuple(str(p) for p in raw)
+        except (ValueError, SyntaxError):
+            pass
+
+        # findall returns the captured strings directly, skipping the Match
+        # object allocation per segment
+        segments = []
+        for segment in _SEGMENT_RE.findall(inner):
+            if (segment.startswith("'") and segment.endswith("'")) or \
+               (segment.startswith('"') and segment.endswith('"')):
+                segment = segment[1:-1]
+            segments.append(segment)
+        return tuple(segments)
+
+    # Fallback: parse dotted notation, treating quoted segments as atomic.
+    # Short inputs take the hand-written tokenizer; long ones stay on the
+    # regex, whose per-call setup then amortizes.
+    if len(path) < 256:
+        return _tokenize(path)
+    # Unmatched findall groups come back as '', so the existing empty-token
+    # filter covers them.
+    return tuple(
+        _intern(dq or sq or uq)
+        for dq, sq, uq in _TOKEN_RE.findall(path)
+        if dq or sq or uq
+    )
+
+
+# deletion table for quote stripping; extend the third argument if single
+# quotes ever need removing too
+_STRIP_QUOTES = str.maketrans("", "", '"')
+
+
 def path_to_list(path: Union[str, list[str]]) -> list[str]:
     if isinstance(path, list):
-        return [p.replace('"', "") for p in path if p]
+        return [p.translate(_STRIP_QUOTES) for p in path if p]
 
     if not isinstance(path, str):
         raise ValueError("path must be a string or list of strings")
 
-    # Regex to detect bracketed list strings like: [a, b, "c d", 'e f']
-    bracketed_pattern = re.compile(r'^\s*\[(.*)\]\s*$')
-
-    m = bracketed_pattern.match(path)
-    if m:
-        inner = m.group(1)
-
-        # Regex to capture segments, quoted or unquoted, separated by commas
-        segment_pattern = re.compile(r'''
-            \s*                         # optional leading whitespace
-            (                           # capture group for segment
-              "(?:[^"\\]|\\.)*"         |  # double quoted string (with escapes)
-              '(?:[^'\\]|\\.)*'         |  # single quoted string (with escapes)
-              [^,'" ](?:[^,]*)?            # unquoted segment (no commas or quotes)
-            )
-            \s*                         # optional trailing whitespace
-            (?:,|$)                     # comma or end of string
-        ''', re.VERBOSE)
-
-        segments = []
-        for match in segment_pattern.finditer(inner):
-            segment = match.group(1)
-            if (segment.startswith("'") and segment.endswith("'")) or \
-               (segment.startswith('"') and segment.endswith('"')):
-                segment = segment[1:-1]
-            segments.append(segment)
-        return segments
-
-    # Fallback: parse dotted notation, treating quoted segments as atomic
-    token_pattern = re.compile(r'''
-        "(.*?)"       |   # group 1: double-quoted segment (may contain dots)
-        '(.*?)'       |   # group 2: single-quoted segment (may contain dots)
-        ([^.]+)           # group 3: unquoted segment (no dots allowed)
-    ''', re.VERBOSE)
-
-    tokens = []
-    for match in token_pattern.finditer(path):
-        dq, sq, uq = match.groups()
-        if dq is not None:
-            tokens.append(dq)
-        elif sq is not None:
-            tokens.append(sq)
-        elif uq is not None:
-            tokens.append(uq)
-    return [t for t in tokens if t]
+    return list(_path_to_list_str(path))
+
+
+# ASCII record separator; joined as ".\x1e." so the boundary token can never
+# fuse with a path segment in the tokenizer
+_PATH_SEP = "\x1e"
+
+
+def paths_to_lists(paths: list[str]) -> list[list[str]]:
+    """Parses many path strings with a single tokenizer pass.
+
+    The inputs are joined with a record separator and run through one
+    `findall`, amortizing the per-call regex setup over the whole batch.
+    Bracketed inputs, inputs containing the separator and inputs with
+    unbalanced quotes (whose quoted-segment match could span into the next
+    path) fall back to `path_to_list` per string.
+    """
+    if not paths:
+        return []
+    if any(
+        _PATH_SEP in p
+        or _is_bracketed(p.strip())
+        or p.count('"') % 2
+        or p.count("'") % 2
+        for p in paths
+    ):
+        return [path_to_list(p) for p in paths]
+    results: list[list[str]] = []
+    current: list[str] = []
+    joined = f".{_PATH_SEP}.".join(paths)
+    for dq, sq, uq in _TOKEN_RE.findall(joined):
+        token = dq or sq or uq
+        if token == _PATH_SEP:
+            results.append(current)
+            current = []
+        elif token:
+            current.append(token)
+    results.append(current)
+    return results
+
+
+@lru_cache(maxsize=1024)
+def _path_to_dotted_str(path: str) -> str:
+    inner = '"."'.join(_path_to_list_str(path))
+    # the f-string builds the result in one preallocated buffer instead of
+    # two '+' concatenations
+    return f'"{inner}"'
 
 
 def path_to_dotted(path: Union[list[str], str]) -> str:
-    path = path_to_list(path)
-    return '"' + '"."'.join(path) + '"'
+    if isinstance(path, str):
+        # the same paths are dotted over and over across query construction
+        # and catalog lookups; cache the final string per input
+        return _path_to_dotted_str(path)
+    # list input: only pay the quote-stripping pass when a quote is present
+    if any('"' in p for p in path):
+        path = [p.translate(_STRIP_QUOTES) for p in path if p]
+    inner = '"."'.join(p for p in path if p)
+    return f'"{inner}"'
 
 
 def clear_at(d: dict) -> dict:
-    res = {}
-
-    for k, v in d.items():
-        if k[0] == "@":
-            res[k[1:]] = v
-            continue
-        res[k] = v
-
-    return res
\ No newline at end of file
+    return {(k[1:] if k.startswith("@") else k): v for k, v in d.items()}
\ No newline at end of file
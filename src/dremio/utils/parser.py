@@ -1,21 +1,29 @@
 import re
+from functools import lru_cache
+
 from .converter import path_to_list, path_to_dotted
 
 
 RE = r"(FROM|JOIN)\s+([\w\d\.\"]+)(?:\s*\(?\s*(\w+)\s*\)?)?"
 
+_SOURCE_RE = re.compile(RE, re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _sql_sources(sql: str) -> tuple[str, ...]:
+    return tuple(m[1] for m in _SOURCE_RE.findall(sql))
+
 
 def sql_source_parser(sql: str) -> list:
-    matches = re.findall(RE, sql, re.IGNORECASE)
-    return [m[1] for m in matches]
+    return list(_sql_sources(sql))
 
 
 def dependencies_list_from_sql(sql: str) -> list[list[str]]:
-    return [path_to_list(s) for s in sql_source_parser(sql) if s]
+    return [path_to_list(s) for s in _sql_sources(sql) if s]
 
 
 def dependencies_dotted_from_sql(sql: str) -> list[str]:
-    return [path_to_dotted(s) for s in sql_source_parser(sql) if s]
+    return [path_to_dotted(s) for s in _sql_sources(sql) if s]
 
 
 def cut_scheme(url: str) -> str:
@@ -1,5 +1,5 @@
 import pytest
-from src.dremio.utils.converter import path_to_list, path_to_dotted
+from src.dremio.utils.converter import path_to_list, path_to_dotted, paths_to_lists
 
 @pytest.mark.parametrize(
         "input_path,expected",
@@ -25,4 +25,18 @@ def test_path_to_list(input_path, expected):
                 pytest.param("one", '"one"', id="single_segment"),
             ])
 def test_path_to_dotted(input_path, expected):
-    assert path_to_dotted(input_path) == expected
\ No newline at end of file
+    assert path_to_dotted(input_path) == expected
+
+@pytest.mark.parametrize(
+        "input_paths",
+            [
+                pytest.param([], id="empty_batch"),
+                pytest.param(["a.b.c"], id="single_path"),
+                pytest.param(["a.b.c", "x.y", "one"], id="dotted_paths"),
+                pytest.param(['a.b."c.d"', "x.y"], id="with_dot_in_name"),
+                pytest.param(["a.b", "", "x"], id="with_empty_path"),
+                pytest.param(["[a, b, c ]", "x.y"], id="bracketed_fallback"),
+                pytest.param(['"a', 'b"'], id="unbalanced_quote_fallback"),
+            ])
+def test_paths_to_lists(input_paths):
+    assert paths_to_lists(input_paths) == [path_to_list(p) for p in input_paths]
\ No newline at end of file
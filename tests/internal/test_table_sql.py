@@ -0,0 +1,86 @@
+from datetime import datetime, date
+
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from src.dremio._mixins._table import (
+    escape_sql_value,
+    map_arrow_type_to_sql,
+    map_dtype_to_sql,
+    sql_value_rows,
+)
+
+
+@pytest.mark.parametrize(
+    "dtype,expected",
+    [
+        pytest.param(pl.Int64, "BIGINT", id="int"),
+        pytest.param(pl.UInt32, "BIGINT", id="uint"),
+        pytest.param(pl.Float64, "DOUBLE", id="float"),
+        pytest.param(pl.Boolean, "BOOLEAN", id="bool"),
+        pytest.param(pl.Datetime, "TIMESTAMP", id="datetime"),
+        pytest.param(pl.Date, "TIMESTAMP", id="date"),
+        pytest.param(pl.Utf8, "VARCHAR", id="string"),
+    ],
+)
+def test_map_dtype_to_sql(dtype, expected):
+    assert map_dtype_to_sql(dtype) == expected
+
+
+@pytest.mark.parametrize(
+    "dtype,expected",
+    [
+        pytest.param(pa.int64(), "BIGINT", id="int"),
+        pytest.param(pa.uint32(), "BIGINT", id="uint"),
+        pytest.param(pa.float64(), "DOUBLE", id="float"),
+        pytest.param(pa.bool_(), "BOOLEAN", id="bool"),
+        pytest.param(pa.timestamp("us"), "TIMESTAMP", id="timestamp"),
+        pytest.param(pa.date32(), "TIMESTAMP", id="date"),
+        pytest.param(pa.string(), "VARCHAR", id="string"),
+    ],
+)
+def test_map_arrow_type_to_sql(dtype, expected):
+    assert map_arrow_type_to_sql(dtype) == expected
+
+
+def test_sql_value_rows_matches_escape_sql_value():
+    df = pl.DataFrame(
+        {
+            "i": [1, None, 3],
+            "f": [1.5, float("nan"), None],
+            "s": ["plain", "it's quoted", None],
+            "b": [True, False, None],
+            "dt": [datetime(2024, 1, 2, 3, 4, 5), None, datetime(2025, 12, 31)],
+            "d": [date(2024, 1, 2), date(2025, 12, 31), None],
+        }
+    )
+    expected = [
+        "(" + ", ".join(escape_sql_value(val) for val in row) + ")"
+        for row in df.iter_rows(named=False)
+    ]
+    assert sql_value_rows(df) == expected
+
+
+def test_sql_value_rows_matches_escape_sql_value_narrow_dtypes():
+    df = pl.DataFrame(
+        {
+            "i32": pl.Series([1, -2, None], dtype=pl.Int32),
+            "u16": pl.Series([0, 65535, None], dtype=pl.UInt16),
+            "f32": pl.Series([1.5, None, float("nan")], dtype=pl.Float32),
+            "dt_us": pl.Series(
+                [datetime(2024, 1, 2, 3, 4, 5, 678901), None],
+                dtype=pl.Datetime("us"),
+            ).extend_constant(None, 1),
+        }
+    )
+    expected = [
+        "(" + ", ".join(escape_sql_value(val) for val in row) + ")"
+        for row in df.iter_rows(named=False)
+    ]
+    assert sql_value_rows(df) == expected
+
+
+def test_sql_value_rows_empty_dataframe():
+    df = pl.DataFrame({"a": pl.Series([], dtype=pl.Int64)})
+    assert sql_value_rows(df) == []